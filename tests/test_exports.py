@@ -0,0 +1,31 @@
+from typing import Any, Dict, List
+
+import pytest
+
+
+@pytest.mark.parametrize(
+    "module, names",
+    [
+        ("tmac.plus_aws", ["ApplicationLoadBalancer"]),
+        ("tmac.plus", ["Browser", "Database", "FileServer"]),
+        (
+            "tmac.threat_library",
+            ["DEFAULT_THREAT_LIBRARY", "DEFAULT_USER_STORY_TEMPLATE_REPOSITORY", "CAPEC_62"],
+        ),
+    ],
+)
+def test_star_import(module: str, names: List[str]) -> None:
+    namespace: Dict[str, Any] = dict()
+    exec(f"from {module} import *", namespace)
+
+    for name in names:
+        assert name in namespace
+
+
+def test_lazy_public_names() -> None:
+    import tmac
+
+    assert set(tmac.__all__) == set(tmac._LAZY_IMPORTS)
+
+    for name in tmac.__all__:
+        assert getattr(tmac, name) is not None
@@ -0,0 +1,73 @@
+from typing import List
+
+import pytest
+
+from tmac import (
+    CAPEC,
+    Component,
+    ComponentRisk,
+    ComponentThreat,
+    Model,
+    Process,
+    Protocol,
+    Technology,
+    ThreatLibrary,
+)
+from tmac.model import _EvaluationIndex
+
+
+class FailingThreat(ComponentThreat):
+    id = "TEST-FAIL"
+    name = "Failing Threat"
+    description = ""
+    risk_text = ""
+    category = CAPEC.MANIPULATE_DATA_STRUCTURES
+
+    def apply(self, model: "Model", component: "Component") -> List["ComponentRisk"]:
+        raise RuntimeError("boom")
+
+
+def test_indexed_flows_match_unindexed_flows(model: "Model") -> None:
+    a = Process(model, "A", technology=Technology.WEB_APPLICATION)
+    b = Process(model, "B", technology=Technology.WEB_APPLICATION)
+    c = Process(model, "C", technology=Technology.WEB_APPLICATION)
+
+    a.add_data_flow("AB", destination=b, protocol=Protocol.HTTPS)
+    a.add_data_flow("AC", destination=c, protocol=Protocol.HTTPS)
+    b.add_data_flow("BC", destination=c, protocol=Protocol.HTTPS)
+    model.accept_risk("CAPEC-63@A")
+
+    unindexed = [
+        (model.get_incoming_flows(p), model.get_outgoing_flows(p)) for p in (a, b, c)
+    ]
+    unindexed_state = model.get_state_by_id("CAPEC-63@A")
+
+    model._index = _EvaluationIndex(model)
+    indexed = [
+        (model.get_incoming_flows(p), model.get_outgoing_flows(p)) for p in (a, b, c)
+    ]
+    indexed_state = model.get_state_by_id("CAPEC-63@A")
+    model._index = None
+
+    for (ui, uo), (ii, io) in zip(unindexed, indexed):
+        assert set(ui) == set(ii)
+        assert set(uo) == set(io)
+    assert unindexed_state is not None
+    assert unindexed_state is indexed_state
+
+
+def test_index_is_cleared_when_evaluation_fails() -> None:
+    lib = ThreatLibrary()
+    lib.add_threats(FailingThreat())
+
+    model = Model("Model", threat_library=lib, skip_validation=True)
+    a = Process(model, "A", technology=Technology.WEB_APPLICATION)
+    b = Process(model, "B", technology=Technology.WEB_APPLICATION)
+
+    with pytest.raises(RuntimeError):
+        model.evaluate()
+
+    model.node.unlock()
+    flow = a.add_data_flow("AB", destination=b, protocol=Protocol.HTTPS)
+
+    assert a.outgoing_flows == [flow]
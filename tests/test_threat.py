@@ -0,0 +1,109 @@
+from typing import List
+
+import pytest
+
+from tmac import (
+    CAPEC,
+    Component,
+    ComponentRisk,
+    ComponentThreat,
+    DataStore,
+    Model,
+    ModelRisk,
+    ModelThreat,
+    Process,
+    SimpleComponentThreat,
+    Technology,
+    ThreatLibrary,
+    UserStoryTemplate,
+    UserStoryTemplateRepository,
+)
+from tmac.threat_library import CAPEC_62
+
+
+class DataStoreThreat(ComponentThreat):
+    id = "TEST-1"
+    name = "Data Store Threat"
+    description = ""
+    risk_text = "Risk at {{ component.name }}"
+    category = CAPEC.MANIPULATE_DATA_STRUCTURES
+    targets = (DataStore,)
+
+    def apply(self, model: "Model", component: "Component") -> List["ComponentRisk"]:
+        return [ComponentRisk(self, model=model, component=component)]
+
+
+class WholeModelThreat(ModelThreat):
+    id = "TEST-2"
+    name = "Model Threat"
+    description = ""
+    risk_text = "Risk at {{ model.name }}"
+    category = CAPEC.MANIPULATE_DATA_STRUCTURES
+
+    def apply(self, model: "Model") -> List["ModelRisk"]:
+        return [ModelRisk(self, model)]
+
+    def get_user_story_templates(
+        self, repository: "UserStoryTemplateRepository"
+    ) -> List["UserStoryTemplate"]:
+        return []
+
+
+def test_apply_dispatches_by_component_type(model: "Model") -> None:
+    lib = ThreatLibrary()
+    lib.add_threats(DataStoreThreat())
+
+    p = Process(model, "Process", technology=Technology.WEB_APPLICATION)
+    ds = DataStore(model, "DataStore", technology=Technology.DATABASE)
+
+    assert len(lib.apply(model, p)) == 0
+    assert len(lib.apply(model, ds)) == 1
+
+    lib.excludes.append("TEST-1")
+    assert len(lib.apply(model, ds)) == 0
+    lib.excludes.remove("TEST-1")
+
+    del lib["TEST-1"]
+    assert len(lib.apply(model, ds)) == 0
+
+
+def test_apply_separates_model_and_component_threats(model: "Model") -> None:
+    lib = ThreatLibrary()
+    lib.add_threats(DataStoreThreat(), WholeModelThreat())
+
+    ds = DataStore(model, "DataStore", technology=Technology.DATABASE)
+
+    assert [r.id for r in lib.apply(model, None)] == ["TEST-2@model"]
+    assert [r.id for r in lib.apply(model, ds)] == [f"TEST-1@{ds.name}"]
+
+
+def test_threat_metadata_is_class_level() -> None:
+    threat = CAPEC_62()
+
+    assert not hasattr(threat, "__dict__")
+    assert threat.id == CAPEC_62.id == "CAPEC-62"
+    assert isinstance(threat.cwe_ids, tuple)
+    assert isinstance(threat.prerequisites, tuple)
+    assert isinstance(threat.references, tuple)
+
+
+def test_component_threats_must_implement_apply_or_triggers() -> None:
+    class IncompleteThreat(ComponentThreat):
+        id = "TEST-3"
+        name = "Incomplete Threat"
+        description = ""
+        risk_text = ""
+        category = CAPEC.MANIPULATE_DATA_STRUCTURES
+
+    class IncompleteSimpleThreat(SimpleComponentThreat):
+        id = "TEST-4"
+        name = "Incomplete Simple Threat"
+        description = ""
+        risk_text = ""
+        category = CAPEC.MANIPULATE_DATA_STRUCTURES
+
+    with pytest.raises(TypeError):
+        IncompleteThreat()  # type: ignore[abstract]
+
+    with pytest.raises(TypeError):
+        IncompleteSimpleThreat()  # type: ignore[abstract]
@@ -0,0 +1,19 @@
+from tmac import ASVSCategory, UserStoryTemplate
+
+
+def test_template_accepts_asvs_category() -> None:
+    tpl = UserStoryTemplate(
+        id="TEST-1",
+        category="API and Web Service",
+        sub_category=ASVSCategory.RESTFUL_WEB_SERVICE,
+        description="",
+        feature_name="",
+        user_story="",
+        scenarios={},
+        references=[],
+        cwe_ids=[],
+        nist=[],
+        tags=[],
+    )
+
+    assert tpl.sub_category == ASVSCategory.RESTFUL_WEB_SERVICE
@@ -0,0 +1,21 @@
+from tmac import DataStore, Model, Process, Protocol, Technology
+from tmac.threat_library import CAPEC_126
+
+threat = CAPEC_126()
+
+def test_apply(model: "Model") -> None:
+    p = Process(model, "WebApp", technology=Technology.WEB_APPLICATION)
+    fs = DataStore(model, "Files", technology=Technology.FILE_SERVER)
+    db = DataStore(model, "Database", technology=Technology.DATABASE)
+
+    flow = p.add_data_flow("FileAccess", destination=fs, protocol=Protocol.SMB)
+    p.add_data_flow("DatabaseAccess", destination=db, protocol=Protocol.SQL)
+
+    assert threat.matches(flow) == True
+
+    risks = threat.apply(model=model, component=p)
+    assert len(risks) == 1
+    assert risks[0].text == "Path-Traversal risk at WebApp against filesystem Files via FileAccess"
+
+    # outgoing flows only
+    assert threat.apply(model=model, component=fs) == []
@@ -0,0 +1,21 @@
+from tmac import DataStore, Model, Process, Protocol, Technology
+from tmac.threat_library import CAPEC_136
+
+threat = CAPEC_136()
+
+def test_apply(model: "Model") -> None:
+    p = Process(model, "WebApp", technology=Technology.WEB_APPLICATION)
+    d = DataStore(model, "Store", technology=Technology.UNKNOWN)
+
+    flow = p.add_data_flow("Matching", destination=d, protocol=Protocol.LDAPS)
+    p.add_data_flow("Other", destination=d, protocol=Protocol.HTTPS)
+
+    assert threat.incoming == False
+    assert threat.matches(flow) == True
+
+    risks = threat.apply(model=model, component=p)
+    assert len(risks) == 1
+    assert risks[0].text == "LDAP Injection risk at WebApp against LDAP server Store via Matching."
+
+    # outgoing flows only
+    assert threat.apply(model=model, component=d) == []
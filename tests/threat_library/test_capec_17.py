@@ -0,0 +1,16 @@
+from tmac import DataFormat, Model, Process, Technology
+from tmac.threat_library import CAPEC_17
+
+threat = CAPEC_17()
+
+def test_apply(model: "Model") -> None:
+    p = Process(model, "Upload", technology=Technology.WEB_APPLICATION, accepts_data_formats=[DataFormat.FILE])
+    q = Process(model, "Api", technology=Technology.WEB_APPLICATION, accepts_data_formats=[DataFormat.JSON])
+
+    assert threat.triggers(p) == True
+    assert threat.triggers(q) == False
+
+    risks = threat.apply(model=model, component=p)
+    assert len(risks) == 1
+    assert risks[0].text == "Using Malicious Files risk at Upload."
+    assert threat.apply(model=model, component=q) == []
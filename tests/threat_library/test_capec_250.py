@@ -0,0 +1,16 @@
+from tmac import DataFormat, Model, Process, Technology
+from tmac.threat_library import CAPEC_250
+
+threat = CAPEC_250()
+
+def test_apply(model: "Model") -> None:
+    p = Process(model, "Soap", technology=Technology.WEB_SERVICE_SOAP, accepts_data_formats=[DataFormat.XML])
+    q = Process(model, "Rest", technology=Technology.WEB_SERVICE_REST, accepts_data_formats=[DataFormat.JSON])
+
+    assert threat.triggers(p) == True
+    assert threat.triggers(q) == False
+
+    risks = threat.apply(model=model, component=p)
+    assert len(risks) == 1
+    assert risks[0].text == "XML Injection risk at Soap."
+    assert threat.apply(model=model, component=q) == []
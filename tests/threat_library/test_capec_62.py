@@ -21,3 +21,13 @@ def test_apply(model: "Model") -> None:
     risks = threat.apply(model=model, component=p)
     assert len(risks) == 1
     assert risks[0].text == "Cross-Site Request Forgery (CSRF) risk at WebApp via WebTrafffic from User"
+
+def test_matches_component(model: "Model") -> None:
+    e = ExternalEntity(model, "User", technology=Technology.BROWSER)
+    p = Process(model, "Api", technology=Technology.WEB_SERVICE_REST)
+
+    e.add_data_flow("ApiTraffic", destination=p, protocol=Protocol.HTTPS)
+
+    assert threat.incoming == True
+    assert threat.matches_component(p) == False
+    assert threat.apply(model=model, component=p) == []
@@ -0,0 +1,16 @@
+from tmac import Model, Process, Technology
+from tmac.threat_library import CAPEC_63
+
+threat = CAPEC_63()
+
+def test_apply(model: "Model") -> None:
+    p = Process(model, "WebApp", technology=Technology.WEB_APPLICATION)
+    q = Process(model, "LB", technology=Technology.LOAD_BALANCER)
+
+    assert threat.triggers(p) == True
+    assert threat.triggers(q) == False
+
+    risks = threat.apply(model=model, component=p)
+    assert len(risks) == 1
+    assert risks[0].text == "Cross-Site Scripting (XSS) risk at WebApp"
+    assert threat.apply(model=model, component=q) == []
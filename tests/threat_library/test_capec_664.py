@@ -0,0 +1,31 @@
+from tmac import Model, Process, Protocol, Technology
+from tmac.threat_library import CAPEC_664
+
+threat = CAPEC_664()
+
+def test_matches_component(model: "Model") -> None:
+    p = Process(model, "WebApp", technology=Technology.WEB_APPLICATION)
+    lb = Process(model, "LB", technology=Technology.LOAD_BALANCER)
+    ui = Process(model, "UI", technology=Technology.WEB_UI)
+
+    assert threat.matches_component(p) == True
+    assert threat.matches_component(lb) == False
+    assert threat.matches_component(ui) == False
+
+def test_apply(model: "Model") -> None:
+    p = Process(model, "WebApp", technology=Technology.WEB_APPLICATION)
+    lb = Process(model, "LB", technology=Technology.LOAD_BALANCER)
+    api = Process(model, "Api", technology=Technology.WEB_SERVICE_REST)
+
+    flow = p.add_data_flow("Request", destination=api, protocol=Protocol.HTTPS)
+    p.add_data_flow("Query", destination=api, protocol=Protocol.SQL)
+    lb.add_data_flow("Forward", destination=p, protocol=Protocol.HTTPS)
+
+    assert threat.incoming == False
+    assert threat.matches(flow) == True
+
+    risks = threat.apply(model=model, component=p)
+    assert len(risks) == 1
+    assert risks[0].text == "Server Side Request Forgery (SSRF) risk at WebApp requesting the target Api via Request."
+
+    assert threat.apply(model=model, component=lb) == []
@@ -0,0 +1,14 @@
+import pytest
+
+import tmac.threat_library as threat_library
+from tmac import Model
+
+
+def test_default_threat_library(model: "Model") -> None:
+    assert model.threat_library is threat_library.DEFAULT_THREAT_LIBRARY
+    assert "CAPEC-62" in threat_library.DEFAULT_THREAT_LIBRARY
+
+
+def test_unknown_attribute() -> None:
+    with pytest.raises(AttributeError):
+        threat_library.UNKNOWN
@@ -1,35 +1,102 @@
-from .asset import Asset
-from .component import (
-    Component,
-    DataFormat,
-    DataStore,
-    Encryption,
-    ExternalEntity,
-    Machine,
-    Process,
-    Technology,
-)
-from .data_flow import Authentication, Authorization, DataFlow, Protocol
-from .diagram import DataFlowDiagram, DiagramEdge, DiagramNode
-from .element import Element
-from .model import Model, ModelException
-from .node import Construct
-from .risk import ComponentRisk, ModelRisk, Risk
-from .score import Score
-from .table_format import TableFormat
-from .tag import TagMixin
-from .threat import (
-    CAPEC,
-    LINDDUM,
-    STRIDE,
-    BaseThreat,
-    Category,
-    ComponentThreat,
-    ModelThreat,
-    ThreatLibrary,
-)
-from .trust_boundary import TrustBoundary
-from .user_story import ASVSCategory, UserStory, UserStoryTemplate, UserStoryTemplateRepository
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List
+
+if TYPE_CHECKING:
+    from .asset import Asset
+    from .component import (
+        Component,
+        DataFormat,
+        DataStore,
+        Encryption,
+        ExternalEntity,
+        Machine,
+        Process,
+        Technology,
+    )
+    from .data_flow import Authentication, Authorization, DataFlow, Protocol
+    from .diagram import DataFlowDiagram, DiagramEdge, DiagramNode
+    from .element import Element
+    from .model import Model, ModelException
+    from .node import Construct
+    from .risk import ComponentRisk, ModelRisk, Risk
+    from .score import Score
+    from .table_format import TableFormat
+    from .tag import TagMixin
+    from .threat import (
+        CAPEC,
+        LINDDUM,
+        STRIDE,
+        BaseThreat,
+        Category,
+        ComponentThreat,
+        DataFlowThreat,
+        ModelThreat,
+        SimpleComponentThreat,
+        ThreatLibrary,
+    )
+    from .trust_boundary import TrustBoundary
+    from .user_story import ASVSCategory, UserStory, UserStoryTemplate, UserStoryTemplateRepository
+
+# Public names are imported from their submodule on first access, so that
+# importing tmac does not load every module up front.
+_LAZY_IMPORTS: Dict[str, str] = {
+    "Asset": ".asset",
+    "Component": ".component",
+    "DataFormat": ".component",
+    "DataStore": ".component",
+    "Encryption": ".component",
+    "ExternalEntity": ".component",
+    "Machine": ".component",
+    "Process": ".component",
+    "Technology": ".component",
+    "Authentication": ".data_flow",
+    "Authorization": ".data_flow",
+    "DataFlow": ".data_flow",
+    "Protocol": ".data_flow",
+    "DataFlowDiagram": ".diagram",
+    "DiagramEdge": ".diagram",
+    "DiagramNode": ".diagram",
+    "Element": ".element",
+    "Model": ".model",
+    "ModelException": ".model",
+    "Construct": ".node",
+    "ComponentRisk": ".risk",
+    "ModelRisk": ".risk",
+    "Risk": ".risk",
+    "Score": ".score",
+    "TableFormat": ".table_format",
+    "TagMixin": ".tag",
+    "CAPEC": ".threat",
+    "LINDDUM": ".threat",
+    "STRIDE": ".threat",
+    "BaseThreat": ".threat",
+    "Category": ".threat",
+    "ComponentThreat": ".threat",
+    "DataFlowThreat": ".threat",
+    "ModelThreat": ".threat",
+    "SimpleComponentThreat": ".threat",
+    "ThreatLibrary": ".threat",
+    "TrustBoundary": ".trust_boundary",
+    "ASVSCategory": ".user_story",
+    "UserStory": ".user_story",
+    "UserStoryTemplate": ".user_story",
+    "UserStoryTemplateRepository": ".user_story",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = (
     "Asset",
@@ -64,7 +131,9 @@ __all__ = (
     "BaseThreat",
     "Category",
     "ComponentThreat",
+    "DataFlowThreat",
     "ModelThreat",
+    "SimpleComponentThreat",
     "ThreatLibrary",
     "TrustBoundary",
     "ASVSCategory",
@@ -53,6 +53,31 @@ class Technology(Enum):
         return str(self.value)
 
 
+CLIENT_TECHNOLOGIES = frozenset(
+    {
+        Technology.BROWSER,
+        Technology.DESKTOP,
+        Technology.MOBILE_APP,
+        Technology.WEB_UI,
+    }
+)
+
+WEB_APPLICATION_TECHNOLOGIES = frozenset(
+    {
+        Technology.WEB_APPLICATION,
+        Technology.WEB_SERVER,
+    }
+)
+
+WEB_SERVICE_TECHNOLOGIES = frozenset(
+    {
+        Technology.WEB_SERVICE_REST,
+        Technology.WEB_SERVICE_SOAP,
+        Technology.WEB_SERVICE_GRAPHQL,
+    }
+)
+
+
 class Encryption(Enum):
     NONE = "none"
     TRANSPARENT = "transparent"
@@ -121,21 +146,11 @@ class Component(Element, TagMixin, metaclass=ABCMeta):
 
     @property
     def incoming_flows(self) -> List["DataFlow"]:
-        flows: Set["DataFlow"] = set()
-        for flow in self._model.data_flows:
-            if flow.destination == self:
-                flows.add(flow)
-
-        return list(flows)
+        return self._model.get_incoming_flows(self)
 
     @property
     def outgoing_flows(self) -> List["DataFlow"]:
-        flows: Set["DataFlow"] = set()
-        for flow in self._model.data_flows:
-            if flow.source == self:
-                flows.add(flow)
-
-        return list(flows)
+        return self._model.get_outgoing_flows(self)
 
     @property
     def otm(self) -> "OpenThreatModelComponent":
@@ -172,27 +187,15 @@ class Component(Element, TagMixin, metaclass=ABCMeta):
 
     @property
     def is_client(self) -> bool:
-        return self.technology in [
-            Technology.BROWSER,
-            Technology.DESKTOP,
-            Technology.MOBILE_APP,
-            Technology.WEB_UI,
-        ]
+        return self.technology in CLIENT_TECHNOLOGIES
 
     @property
     def is_web_application(self) -> bool:
-        return self.technology in [
-            Technology.WEB_APPLICATION,
-            Technology.WEB_SERVER,
-        ]
+        return self.technology in WEB_APPLICATION_TECHNOLOGIES
 
     @property
     def is_web_service(self) -> bool:
-        return self.technology in [
-            Technology.WEB_SERVICE_REST,
-            Technology.WEB_SERVICE_SOAP,
-            Technology.WEB_SERVICE_GRAPHQL,
-        ]
+        return self.technology in WEB_SERVICE_TECHNOLOGIES
 
     def processes(self, *assets: "Asset") -> None:
         for asset in assets:
@@ -56,6 +56,56 @@ class Protocol(Enum):
         return str(self.value)
 
 
+RELATIONAL_DATABASE_PROTOCOLS = frozenset(
+    {
+        Protocol.JDBC,
+        Protocol.JDBC_ENCRYPTED,
+        Protocol.ODBC,
+        Protocol.ODBC_ENCRYPTED,
+        Protocol.SQL,
+        Protocol.SQL_ENCRYPTED,
+    }
+)
+
+NOSQL_DATABASE_PROTOCOLS = frozenset(
+    {
+        Protocol.NOSQL,
+        Protocol.NOSQL_ENCRYPTED,
+    }
+)
+
+WEB_ACCESS_PROTOCOLS = frozenset(
+    {
+        Protocol.HTTP,
+        Protocol.HTTPS,
+        Protocol.WS,
+        Protocol.WSS,
+    }
+)
+
+ENCRYPTED_PROTOCOLS = frozenset(
+    {
+        Protocol.HTTPS,
+        Protocol.WSS,
+        Protocol.JDBC_ENCRYPTED,
+        Protocol.ODBC_ENCRYPTED,
+        Protocol.NOSQL_ENCRYPTED,
+        Protocol.SQL_ENCRYPTED,
+        Protocol.BINARY_ENCRYPTED,
+        Protocol.TEXT_ENCRYPTED,
+        Protocol.SSH,
+        Protocol.SSH_TUNNEL,
+        Protocol.FTPS,
+        Protocol.SCP,
+        Protocol.LDAPS,
+        Protocol.SMB_ENCRYPTED,
+        Protocol.SMTP_ENCRYPTED,
+        Protocol.POP3_ENCRYPTED,
+        Protocol.IMAP_ENCRYPTED,
+    }
+)
+
+
 class Authentication(Enum):
     NONE = "none"
     CREDENTIALS = "credentials"
@@ -211,52 +261,19 @@ class DataFlow(Element, TagMixin):
 
     @property
     def is_relational_database_protocol(self) -> bool:
-        return self.protocol in [
-            Protocol.JDBC,
-            Protocol.JDBC_ENCRYPTED,
-            Protocol.ODBC,
-            Protocol.ODBC_ENCRYPTED,
-            Protocol.SQL,
-            Protocol.SQL_ENCRYPTED,
-        ]
+        return self.protocol in RELATIONAL_DATABASE_PROTOCOLS
 
     @property
     def is_nosql_database_protocol(self) -> bool:
-        return self.protocol in [
-            Protocol.NOSQL,
-            Protocol.NOSQL_ENCRYPTED,
-        ]
+        return self.protocol in NOSQL_DATABASE_PROTOCOLS
 
     @property
     def is_web_access_protocol(self) -> bool:
-        return self.protocol in [
-            Protocol.HTTP,
-            Protocol.HTTPS,
-            Protocol.WS,
-            Protocol.WSS,
-        ]
+        return self.protocol in WEB_ACCESS_PROTOCOLS
 
     @property
     def is_encrypted(self) -> bool:
-        return self.vpn or self.protocol in [
-            Protocol.HTTPS,
-            Protocol.WSS,
-            Protocol.JDBC_ENCRYPTED,
-            Protocol.ODBC_ENCRYPTED,
-            Protocol.NOSQL_ENCRYPTED,
-            Protocol.SQL_ENCRYPTED,
-            Protocol.BINARY_ENCRYPTED,
-            Protocol.TEXT_ENCRYPTED,
-            Protocol.SSH,
-            Protocol.SSH_TUNNEL,
-            Protocol.FTPS,
-            Protocol.SCP,
-            Protocol.LDAPS,
-            Protocol.SMB_ENCRYPTED,
-            Protocol.SMTP_ENCRYPTED,
-            Protocol.POP3_ENCRYPTED,
-            Protocol.IMAP_ENCRYPTED,
-        ]
+        return self.vpn or self.protocol in ENCRYPTED_PROTOCOLS
 
     def create_data_flow_diagram(
         self, auto_view: bool = True, hide_data_flow_labels: bool = False
@@ -13,10 +13,6 @@ from .otm import OpenThreatModel, OpenThreatModelProject
 from .table_format import TableFormat
 from .tag import TagMixin
 from .threat import ThreatLibrary
-from .threat_library import (
-    DEFAULT_THREAT_LIBRARY,
-    DEFAULT_USER_STORY_TEMPLATE_REPOSITORY,
-)
 from .trust_boundary import TrustBoundary
 from .user_story import UserStoryTemplateRepository
 
@@ -67,16 +63,19 @@ class Model(Construct, TagMixin):
         self.skip_validation = skip_validation
 
         if user_story_template_repository is None:
+            from .threat_library import DEFAULT_USER_STORY_TEMPLATE_REPOSITORY
             self.user_story_template_repository = DEFAULT_USER_STORY_TEMPLATE_REPOSITORY
         else:
             self.user_story_template_repository = user_story_template_repository
 
         if threat_library is None:
+            from .threat_library import DEFAULT_THREAT_LIBRARY
             self.threat_library = DEFAULT_THREAT_LIBRARY
         else:
             self.threat_library = threat_library
 
         self._risks: Dict[str, "Risk"] = dict()
+        self._index: Optional["_EvaluationIndex"] = None
 
     @property
     def assets(self) -> List["Asset"]:
@@ -139,7 +138,20 @@ class Model(Construct, TagMixin):
             # mitigations=[m.otm for m in self.mitigations],
         )
 
+    def get_incoming_flows(self, component: "Component") -> List["DataFlow"]:
+        if self._index is not None:
+            return list(self._index.incoming_flows.get(component, []))
+        return [flow for flow in self.data_flows if flow.destination == component]
+
+    def get_outgoing_flows(self, component: "Component") -> List["DataFlow"]:
+        if self._index is not None:
+            return list(self._index.outgoing_flows.get(component, []))
+        return [flow for flow in self.data_flows if flow.source == component]
+
     def get_state_by_id(self, id: str) -> Optional["ModelState"]:
+        if self._index is not None:
+            return self._index.states.get(id)
+
         for state in self.states:
             if state.id == id:
                 return state
@@ -286,19 +298,41 @@ class Model(Construct, TagMixin):
 
         self._risks = dict()
 
-        # ModelRisks
-        model_risks = self.threat_library.apply(self, component=None)
-        for risk in model_risks:
-            self._risks[risk.id] = risk
-
-        # ComponentRisks
-        for c in self.components:
-            for risk in c.risks:
+        # The construct tree is locked, so flow and state lookups can be
+        # resolved from a single traversal instead of one per threat.
+        self._index = _EvaluationIndex(self)
+        try:
+            # ModelRisks
+            model_risks = self.threat_library.apply(self, component=None)
+            for risk in model_risks:
                 self._risks[risk.id] = risk
 
+            # ComponentRisks
+            for c in self.components:
+                for risk in c.risks:
+                    self._risks[risk.id] = risk
+        finally:
+            self._index = None
+
         self.node.unlock()
 
 
+class _EvaluationIndex:
+    """Lookup tables over the construct tree of a locked model."""
+
+    def __init__(self, model: "Model") -> None:
+        self.incoming_flows: Dict["Component", List["DataFlow"]] = dict()
+        self.outgoing_flows: Dict["Component", List["DataFlow"]] = dict()
+        self.states: Dict[str, "ModelState"] = dict()
+
+        for c in model.node.find_all():
+            if isinstance(c, DataFlow):
+                self.incoming_flows.setdefault(c.destination, []).append(c)
+                self.outgoing_flows.setdefault(c.source, []).append(c)
+            elif isinstance(c, ModelState):
+                self.states.setdefault(c.id, c)
+
+
 class ModelState(Construct):
     def __init__(
         self,
@@ -4,6 +4,16 @@ from typing import Any, Dict, List, Callable, Optional, cast
 
 
 class Node:
+    __slots__ = (
+        "_id",
+        "_scope",
+        "_host",
+        "_locked",
+        "_children",
+        "_validations",
+        "_context",
+    )
+
     @staticmethod
     def of(construct: "Construct") -> "Node":
         return construct.node
@@ -1,7 +1,8 @@
 from .client_side import Browser
-from .data_store import Database
+from .data_store import Database, FileServer
 
 __all__ = (
     "Browser",
     "Database",
+    "FileServer",
 )
@@ -1,5 +1,5 @@
 from .application_load_balancer import ApplicationLoadBalancer
 
 __all__ = (
-    "ApplicationLoadBalancer"
-)
\ No newline at end of file
+    "ApplicationLoadBalancer",
+)
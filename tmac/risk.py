@@ -1,8 +1,7 @@
 from abc import ABC, abstractproperty
-from typing import TYPE_CHECKING, List, Optional, Set, cast
-
-from jinja2 import Template
+from typing import TYPE_CHECKING, List, Optional, Set, Tuple, cast
 
+from .template import compile_template
 from .threat import ComponentThreat, ModelThreat
 from .user_story import ComponentUserStory, ModelUserStory, UserStory
 
@@ -12,13 +11,22 @@ if TYPE_CHECKING:
     from .model import Model
     from .threat import BaseThreat, Category
 
+
+# Treatment states for which no user stories are raised anymore.
+_RESOLVED_TREATMENT_STATES = frozenset({"accepted", "transferred", "n/a", "mitigated"})
+
+
 class RiskTreatment:
+    __slots__ = ("state", "ticket", "comment")
+
     def __init__(self, state: str, *, ticket: str = "", comment: str = "") -> None:
         self.state = state
         self.ticket = ticket
         self.comment = comment
 
 class Risk(ABC):
+    __slots__ = ("_threat", "_model", "_treatment")
+
     def __init__(
         self,
         threat: "BaseThreat",
@@ -49,7 +57,7 @@ class Risk(ABC):
         return self._threat.description
 
     @property
-    def prerequisites(self) -> List[str]:
+    def prerequisites(self) -> Tuple[str, ...]:
         return self._threat.prerequisites
 
     @property
@@ -75,7 +83,7 @@ class Risk(ABC):
         if self._treatment.state != "unchecked":
             return self._treatment
         
-        if all(story.state in ["closed"] for story in self.user_stories):
+        if all(story.state == "closed" for story in self.user_stories):
             return RiskTreatment("mitigated", comment="All user stories are closed")
 
         if any(story.state != "draft" for story in self.user_stories):
@@ -88,6 +96,8 @@ class Risk(ABC):
 
 
 class ComponentRisk(Risk):
+    __slots__ = ("_component", "_data_flow")
+
     def __init__(
         self,
         threat: "BaseThreat",
@@ -109,7 +119,7 @@ class ComponentRisk(Risk):
 
     @property
     def text(self) -> str:
-        return Template(self._threat.risk_text).render(
+        return compile_template(self._threat.risk_text).render(
             component=self._component, data_flow=self._data_flow, model=self._model
         )
 
@@ -123,7 +133,7 @@ class ComponentRisk(Risk):
 
     @property
     def user_stories(self) -> List["UserStory[Risk]"]:
-        if self._treatment.state in ["accepted", "transferred", "n/a", "mitigated"]:
+        if self._treatment.state in _RESOLVED_TREATMENT_STATES:
             return []
 
         stories: Set["ComponentUserStory"] = set()
@@ -149,6 +159,8 @@ class ComponentRisk(Risk):
 
 
 class ModelRisk(Risk):
+    __slots__ = ()
+
     def __init__(
         self,
         threat: "BaseThreat",
@@ -162,7 +174,7 @@ class ModelRisk(Risk):
 
     @property
     def text(self) -> str:
-        return Template(self._threat.risk_text).render(model=self._model)
+        return compile_template(self._threat.risk_text).render(model=self._model)
 
     @property
     def user_stories(self) -> List["UserStory[Risk]"]:
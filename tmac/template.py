@@ -0,0 +1,12 @@
+from functools import lru_cache
+
+from jinja2 import Template
+
+
+@lru_cache(maxsize=1024)
+def compile_template(source: str) -> Template:
+    """Returns the compiled jinja template for the given source.
+
+    Risk and user story texts are rendered from a small, fixed set of
+    template sources, so each one is compiled only once."""
+    return Template(source)
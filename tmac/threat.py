@@ -2,17 +2,22 @@ from abc import ABC, abstractmethod
 from enum import Enum
 from typing import (
     Callable,
+    ClassVar,
     Dict,
     List,
     MutableMapping,
     Iterator,
     Optional,
     Sequence,
+    Tuple,
+    Type,
     TYPE_CHECKING,
 )
 
+from .component import Component
+
 if TYPE_CHECKING:
-    from .component import Component
+    from .data_flow import DataFlow
     from .model import Model
     from .risk import ComponentRisk, ModelRisk, Risk
     from .user_story import UserStoryTemplate, UserStoryTemplateRepository
@@ -134,38 +139,42 @@ class ThreatLibrary(MutableMapping[str, "BaseThreat"]):
         self._lib: Dict[str, "BaseThreat"] = dict()
         self.after_apply_hook: Optional[Callable[[Sequence["Risk"]], None]] = None
 
+        self._model_threats: Optional[List["ModelThreat"]] = None
+        self._component_threats: Dict[Type["Component"], List["ComponentThreat"]] = dict()
+
     def add_threats(self, *threats: "BaseThreat") -> None:
         for threat in threats:
             self._lib[threat.id] = threat
+        self._invalidate_index()
 
     def apply(
         self, model: "Model", component: Optional["Component"]
     ) -> List["Risk"]:
         risks: List["Risk"] = list()
 
-        for item in self.values():
-            if item.id in self.excludes:
-                continue
-
-            if isinstance(item, ComponentThreat) and component is not None:
-                if item.is_applicable(component):
-                    component_risks = item.apply(model, component)
-                    
-                    if self.after_apply_hook is not None:
-                        self.after_apply_hook(component_risks)    
-                    
-                    risks.extend(component_risks)
+        if component is None:
+            for model_threat in self._get_model_threats():
+                if model_threat.id in self.excludes:
                     continue
-                    
 
-            if isinstance(item, ModelThreat) and component is None:
-                model_risks = item.apply(model)
+                model_risks = model_threat.apply(model)
 
                 if self.after_apply_hook is not None:
-                        self.after_apply_hook(model_risks)
+                    self.after_apply_hook(model_risks)
 
                 risks.extend(model_risks)
-                continue
+        else:
+            for component_threat in self._get_component_threats(type(component)):
+                if component_threat.id in self.excludes:
+                    continue
+
+                if component_threat.is_applicable(component):
+                    component_risks = component_threat.apply(model, component)
+
+                    if self.after_apply_hook is not None:
+                        self.after_apply_hook(component_risks)
+
+                    risks.extend(component_risks)
 
         # Update states
         for risk in risks:
@@ -179,14 +188,45 @@ class ThreatLibrary(MutableMapping[str, "BaseThreat"]):
         
         return risks
 
+    def _get_model_threats(self) -> List["ModelThreat"]:
+        if self._model_threats is None:
+            self._model_threats = [
+                t for t in self._lib.values() if isinstance(t, ModelThreat)
+            ]
+        return self._model_threats
+
+    def _get_component_threats(
+        self, component_type: Type["Component"]
+    ) -> List["ComponentThreat"]:
+        """Returns the component threats targeting the given component type.
+
+        The lookup is resolved once per concrete component type and cached
+        until the library is modified."""
+        threats = self._component_threats.get(component_type)
+        if threats is None:
+            threats = [
+                t
+                for t in self._lib.values()
+                if isinstance(t, ComponentThreat)
+                and issubclass(component_type, t.targets)
+            ]
+            self._component_threats[component_type] = threats
+        return threats
+
+    def _invalidate_index(self) -> None:
+        self._model_threats = None
+        self._component_threats.clear()
+
     def __getitem__(self, id: str) -> "BaseThreat":
         return self._lib[id]
 
     def __setitem__(self, id: str, value: "BaseThreat") -> None:
         self._lib[id] = value
+        self._invalidate_index()
 
     def __delitem__(self, id: str) -> None:
         del self._lib[id]
+        self._invalidate_index()
 
     def __iter__(self) -> Iterator[str]:
         return iter(self._lib)
@@ -196,48 +236,26 @@ class ThreatLibrary(MutableMapping[str, "BaseThreat"]):
 
 
 class BaseThreat(ABC):
-    def __init__(
-        self,
-        id: str,
-        name: str,
-        description: str,
-        risk_text: str,
-        category: Category,
-        cwe_ids: List[int] = [],
-        prerequisites: List[str] = [],
-        references: List[str] = [],
-    ) -> None:
-        self._id = id
-        self._name = name
-        self.description = description
-        self.risk_text = risk_text
-        self.category = category
-        self.cwe_ids = cwe_ids
-        self.prerequisites = prerequisites
-        self.references = references
-
-    @property
-    def id(self) -> str:
-        return self._id
-
-    @property
-    def name(self) -> str:
-        return self._name
+    """Base class of all threats.
+
+    The descriptive metadata of a threat is immutable and declared as class
+    attributes, so threat instances are stateless flyweights.
+    """
+
+    __slots__ = ()
+
+    id: ClassVar[str]
+    name: ClassVar[str]
+    description: ClassVar[str]
+    risk_text: ClassVar[str]
+    category: ClassVar[Category]
+    cwe_ids: ClassVar[Tuple[int, ...]] = ()
+    prerequisites: ClassVar[Tuple[str, ...]] = ()
+    references: ClassVar[Tuple[str, ...]] = ()
 
 
 class ModelThreat(BaseThreat):
-    def __init__(
-        self,
-        id: str,
-        name: str,
-        description: str,
-        risk_text: str,
-        category: Category,
-        cwe_ids: List[int] = [],
-        prerequisites: List[str] = [],
-        references: List[str] = [],
-    ) -> None:
-        super().__init__(id, name, description, risk_text, category, cwe_ids, prerequisites, references)
+    __slots__ = ()
 
     @abstractmethod
     def apply(self, model: "Model") -> List["ModelRisk"]:
@@ -251,18 +269,10 @@ class ModelThreat(BaseThreat):
 
 
 class ComponentThreat(BaseThreat):
-    def __init__(
-        self,
-        id: str,
-        name: str,
-        description: str,
-        risk_text: str,
-        category: Category,
-        cwe_ids: List[int] = [],
-        prerequisites: List[str] = [],
-        references: List[str] = [],
-    ) -> None:
-        super().__init__(id, name, description, risk_text, category, cwe_ids, prerequisites, references)
+    __slots__ = ()
+
+    targets: ClassVar[Tuple[Type["Component"], ...]] = (Component,)
+    """The component types the threat is evaluated against."""
 
     def is_applicable(self, component: "Component") -> bool:
         if component.out_of_scope:
@@ -279,3 +289,60 @@ class ComponentThreat(BaseThreat):
         self, repository: "UserStoryTemplateRepository", component: "Component"
     ) -> List["UserStoryTemplate"]:
         return repository.get_by_cwe(*self.cwe_ids)
+
+
+class SimpleComponentThreat(ComponentThreat):
+    """A component threat that raises a single risk for every component
+    it triggers on."""
+
+    __slots__ = ()
+
+    @abstractmethod
+    def triggers(self, component: "Component") -> bool:
+        pass
+
+    def apply(
+        self, model: "Model", component: "Component"
+    ) -> List["ComponentRisk"]:
+        if not self.triggers(component):
+            return []
+
+        # import when need to avoid circular import
+        from .risk import ComponentRisk
+
+        return [ComponentRisk(self, model=model, component=component)]
+
+
+class DataFlowThreat(ComponentThreat):
+    """A component threat that is raised once for every data flow of the
+    component the threat matches."""
+
+    __slots__ = ()
+
+    incoming: ClassVar[bool] = False
+    """Whether the incoming instead of the outgoing flows are inspected."""
+
+    def matches_component(self, component: "Component") -> bool:
+        """Returns False if none of the component's flows can match."""
+        return True
+
+    @abstractmethod
+    def matches(self, flow: "DataFlow") -> bool:
+        pass
+
+    def apply(
+        self, model: "Model", component: "Component"
+    ) -> List["ComponentRisk"]:
+        if not self.matches_component(component):
+            return []
+
+        # import when need to avoid circular import
+        from .risk import ComponentRisk
+
+        flows = component.incoming_flows if self.incoming else component.outgoing_flows
+
+        return [
+            ComponentRisk(self, component=component, data_flow=flow, model=model)
+            for flow in flows
+            if self.matches(flow)
+        ]
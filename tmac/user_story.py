@@ -1,9 +1,10 @@
 import json
+import sys
 from abc import ABC, abstractproperty
 from enum import Enum
 from typing import TYPE_CHECKING, Dict, Generic, List, TypeVar
 
-from jinja2 import Template
+from .template import compile_template
 
 
 if TYPE_CHECKING:
@@ -23,7 +24,14 @@ class UserStoryTemplateRepository:
         with open(filename, "r", encoding="utf8") as tpl_file:
             tpl_json = json.load(tpl_file)
 
+        # Categories, tags and references repeat across hundreds of templates,
+        # so share a single string object for each distinct value.
         for tpl in tpl_json:
+            tpl["category"] = sys.intern(tpl["category"])
+            tpl["sub_category"] = sys.intern(tpl["sub_category"])
+            tpl["references"] = [sys.intern(r) for r in tpl["references"]]
+            tpl["nist"] = [sys.intern(n) for n in tpl["nist"]]
+            tpl["tags"] = [sys.intern(t) for t in tpl["tags"]]
             repostiroy.add_templates(UserStoryTemplate(**tpl))
 
         return repostiroy
@@ -50,6 +58,20 @@ class UserStoryTemplateRepository:
 
 
 class UserStoryTemplate:
+    __slots__ = (
+        "id",
+        "category",
+        "sub_category",
+        "description",
+        "feature_name",
+        "user_story",
+        "scenarios",
+        "references",
+        "cwe_ids",
+        "nist",
+        "tags",
+    )
+
     def __init__(
         self,
         id: str,
@@ -81,6 +103,8 @@ T = TypeVar("T")
 
 
 class UserStory(Generic[T]):
+    __slots__ = ("_id", "_template", "_risk", "state", "ticket", "comment")
+
     def __init__(
         self,
         id: str,
@@ -141,6 +165,8 @@ class UserStory(Generic[T]):
 
 
 class ComponentUserStory(UserStory["ComponentRisk"]):
+    __slots__ = ()
+
     def __init__(
         self,
         id: str,
@@ -154,7 +180,7 @@ class ComponentUserStory(UserStory["ComponentRisk"]):
         if self._template.user_story == "TODO":
             return self.description
 
-        return Template(self._template.user_story).render(
+        return compile_template(self._template.user_story).render(
             component=self._risk.component,
             data_flow=self._risk.data_flow,
             model=self._risk.model,
@@ -162,6 +188,8 @@ class ComponentUserStory(UserStory["ComponentRisk"]):
 
 
 class ModelUserStory(UserStory["ModelRisk"]):
+    __slots__ = ()
+
     def __init__(
         self,
         id: str,
@@ -175,4 +203,4 @@ class ModelUserStory(UserStory["ModelRisk"]):
         if self._template.user_story == "TODO":
             return self.description
 
-        return Template(self._template.user_story).render(model=self._risk.model)
+        return compile_template(self._template.user_story).render(model=self._risk.model)